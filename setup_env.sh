@@ -69,10 +69,10 @@ fi
 # Check and install dependencies
 echo "Checking Python dependencies..."
 # Use conda run to execute commands in the specified environment
-conda run --prefix "$CONDA_ENV" python -c "import matplotlib, numpy" 2>/dev/null
+conda run --prefix "$CONDA_ENV" python -c "import matplotlib, numpy, numba, imageio" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "Installing necessary Python packages..."
-    conda install --prefix "$CONDA_ENV" matplotlib numpy -y
+    conda install --prefix "$CONDA_ENV" matplotlib numpy numba imageio -y
     
     if [ $? -ne 0 ]; then
         echo "Error: Failed to install dependencies"
@@ -96,8 +96,12 @@ conda run --prefix "$CONDA_ENV" python -c "
 try:
     import matplotlib
     import numpy
+    import numba
+    import imageio
     print(f'  matplotlib: {matplotlib.__version__}')
     print(f'  numpy: {numpy.__version__}')
+    print(f'  numba: {numba.__version__}')
+    print(f'  imageio: {imageio.__version__}')
 except ImportError as e:
     print(f'  Error importing packages: {e}')
 "
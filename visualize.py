@@ -7,116 +7,180 @@ Read data files output by C++ program and generate visualization images
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.collections import LineCollection
 import argparse
+import io
+import mmap
+import multiprocessing
+import re
 import sys
 import os
 from PIL import Image
 import glob
 
+# numba is optional: with it the trail update compiles to a straight-line
+# store, without it the pure-Python version below runs as-is
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# imageio is optional: its C-backed GIF encoder is much faster than
+# Pillow's, which remains as the fallback
+try:
+    import imageio.v2 as imageio
+except ImportError:
+    imageio = None
+
+@njit(cache=True)
+def push_trail(tx1, ty1, tx2, ty2, cursor, filled,
+               x1_new, y1_new, x2_new, y2_new):
+    """Write one point into each trail ring buffer and return the new
+    cursor position and fill count"""
+    length = tx1.shape[0]
+    tx1[cursor] = x1_new
+    ty1[cursor] = y1_new
+    tx2[cursor] = x2_new
+    ty2[cursor] = y2_new
+    return (cursor + 1) % length, min(filled + 1, length)
+
+@njit(cache=True, fastmath=True)
+def _absmax4(a):
+    """Largest absolute value in a 2D array, found in one fused sweep"""
+    m = 0.0
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            v = a[i, j]
+            if v < 0.0:
+                v = -v
+            if v > m:
+                m = v
+    return m
+
+def compute_max_range(data):
+    """Axis range that covers both pendulums, with a 10% margin"""
+    positions = data[:, 1:5]
+    if _HAVE_NUMBA:
+        # One min/max-fused sweep over all four columns
+        return 1.1 * _absmax4(positions)
+    # Without numba, two fused NumPy reductions still beat four
+    # np.max(np.abs(...)) passes and their temporary arrays
+    return 1.1 * max(-positions.min(), positions.max())
+
+# Matches the key=value pairs in '#' header lines, e.g. "# L1=1.0 L2=1.0"
+_CONFIG_RE = re.compile(r'([A-Za-z_]\w*)=([-+0-9.eE]+)')
+
+def parse_config_header(mm):
+    """Parse configuration information from the leading '#' lines of a
+    memory-mapped data file, returning the config dict and the byte
+    offset of the first data line"""
+    config_info = {}
+    offset = 0
+    while True:
+        line = mm.readline().decode('ascii', errors='replace')
+        if not line.startswith('#'):
+            break
+        offset = mm.tell()
+        for key, value in _CONFIG_RE.findall(line):
+            config_info[key] = float(value)
+    return config_info, offset
+
+def cache_is_fresh(cache, filename):
+    """Check whether a binary .npy sidecar is newer than the text file"""
+    return (os.path.exists(cache) and
+            os.path.getmtime(cache) >= os.path.getmtime(filename))
+
 def read_pendulum_data(filename):
     """Read double pendulum position data file"""
-    data = []
-    config_info = {}
-    
+    cache = filename + '.npy'
+
     try:
         print("Reading position data file...")
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-            
-        total_lines = len(lines)
-        last_reported_progress = -1
-        
-        for i, line in enumerate(lines):
-            # Calculate and display progress percentage
-            current_progress = int((i * 100.0) / total_lines)
-            if current_progress > last_reported_progress:
-                last_reported_progress = current_progress
-                print(f"\rReading progress: {current_progress}%", end="", flush=True)
-            
-            line = line.strip()
-            if line.startswith('#'):
-                # Parse configuration information
-                if 'L1=' in line and 'L2=' in line:
-                    parts = line.replace('#', '').strip().split()
-                    for part in parts:
-                        if '=' in part:
-                            key, value = part.split('=')
-                            config_info[key] = float(value)
-                continue
-            
-            if line:
-                # Parse data line: time x1 y1 x2 y2
-                values = list(map(float, line.split()))
-                data.append(values)
-        
-        print(f"\rReading progress: 100%")
+        # Map the file into memory so the numeric body is parsed straight
+        # from the OS page cache without an extra userland copy
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # Parse configuration information from the '#' header lines
+                config_info, offset = parse_config_header(mm)
+
+                if cache_is_fresh(cache, filename):
+                    # Reuse the binary sidecar written by a previous run
+                    data = np.load(cache, mmap_mode='r')
+                else:
+                    # Parse all data lines (time x1 y1 x2 y2) in a single
+                    # NumPy call, then cache the result for later runs
+                    data = np.loadtxt(io.BytesIO(mm[offset:]), comments='#',
+                                      dtype=np.float64, ndmin=2)
+                    np.save(cache, data)
+            finally:
+                mm.close()
         print(f"Position data reading completed! Total data points: {len(data)}")
-    
+
     except FileNotFoundError:
         print(f"Error: Cannot find data file {filename}")
         sys.exit(1)
     except Exception as e:
         print(f"Error: Error occurred while reading data file: {e}")
         sys.exit(1)
-    
-    return np.array(data), config_info
+
+    return data, config_info
 
 def read_angle_data(filename):
     """Read double pendulum angle data file"""
-    data = []
-    config_info = {}
-    
+    cache = filename + '.npy'
+
     try:
         print("Reading angle data file...")
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-            
-        total_lines = len(lines)
-        last_reported_progress = -1
-        
-        for i, line in enumerate(lines):
-            # Calculate and display progress percentage
-            current_progress = int((i * 100.0) / total_lines)
-            if current_progress > last_reported_progress:
-                last_reported_progress = current_progress
-                print(f"\rReading progress: {current_progress}%", end="", flush=True)
-            
-            line = line.strip()
-            if line.startswith('#'):
-                # Parse configuration information
-                if 'L1=' in line and 'L2=' in line:
-                    parts = line.replace('#', '').strip().split()
-                    for part in parts:
-                        if '=' in part:
-                            key, value = part.split('=')
-                            config_info[key] = float(value)
-                continue
-            
-            if line:
-                # Parse data line: time theta1 theta2
-                values = list(map(float, line.split()))
-                data.append(values)
-        
-        print(f"\rReading progress: 100%")
+        # Map the file into memory so the numeric body is parsed straight
+        # from the OS page cache without an extra userland copy
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # Parse configuration information from the '#' header lines
+                config_info, offset = parse_config_header(mm)
+
+                if cache_is_fresh(cache, filename):
+                    # Reuse the binary sidecar written by a previous run
+                    data = np.load(cache, mmap_mode='r')
+                else:
+                    # Parse all data lines (time theta1 theta2) in a single
+                    # NumPy call, then cache the result for later runs
+                    data = np.loadtxt(io.BytesIO(mm[offset:]), comments='#',
+                                      dtype=np.float64, ndmin=2)
+                    np.save(cache, data)
+            finally:
+                mm.close()
         print(f"Angle data reading completed! Total data points: {len(data)}")
-    
+
     except FileNotFoundError:
         print(f"Warning: Cannot find angle data file {filename}, skipping angle trajectory plot")
         return None, {}
     except Exception as e:
         print(f"Warning: Error occurred while reading angle data file: {e}, skipping angle trajectory plot")
         return None, {}
-    
-    return np.array(data), config_info
+
+    return data, config_info
 
 def plot_static_trajectories(data, angle_data, config_info, output_file):
     """Plot static trajectory diagram with position and angle trajectories"""
     print("Creating static trajectory plot...")
     
     times = data[:, 0]
-    x1, y1 = data[:, 1], data[:, 2]
-    x2, y2 = data[:, 3], data[:, 4]
-    
+    # Copy each column into a contiguous float32 array; column views of the
+    # (N, 5) buffer have a 5-element stride, and the renderer works in
+    # single precision anyway
+    x1 = np.ascontiguousarray(data[:, 1], dtype=np.float32)
+    y1 = np.ascontiguousarray(data[:, 2], dtype=np.float32)
+    x2 = np.ascontiguousarray(data[:, 3], dtype=np.float32)
+    y2 = np.ascontiguousarray(data[:, 4], dtype=np.float32)
+
     print("Progress: 10% - Setting up plot...")
     
     # Create subplots
@@ -126,9 +190,24 @@ def plot_static_trajectories(data, angle_data, config_info, output_file):
         fig, ax1 = plt.subplots(figsize=(12, 8))
     
     print("Progress: 20% - Drawing position trajectories...")
-    # Draw position trajectories
-    ax1.plot(x1, y1, 'r-', linewidth=2, alpha=0.7, label='The first pendulum path')
-    ax1.plot(x2, y2, 'lightblue', linewidth=2, alpha=0.7, label='The second pendulum path')
+    # Downsample the trajectories before handing them to the rasterizer;
+    # ~50k points already exceed the pixel resolution of the figure
+    stride = max(1, len(x1) // 50000)
+
+    # Draw position trajectories as LineCollections: one Agg path stroke
+    # per trajectory instead of re-tessellating a long Line2D
+    points1 = np.column_stack([x1[::stride], y1[::stride]])
+    points2 = np.column_stack([x2[::stride], y2[::stride]])
+    ax1.add_collection(LineCollection(
+        np.stack([points1[:-1], points1[1:]], axis=1),
+        colors='r', linewidths=2, alpha=0.7, label='The first pendulum path'))
+    ax1.add_collection(LineCollection(
+        np.stack([points2[:-1], points2[1:]], axis=1),
+        colors='lightblue', linewidths=2, alpha=0.7, label='The second pendulum path'))
+    # Collections do not feed the autoscaler, so widen the limits by hand
+    ax1.update_datalim(points1)
+    ax1.update_datalim(points2)
+    ax1.autoscale_view()
     
     print("Progress: 40% - Adding markers and points...")
     # Draw starting points
@@ -154,8 +233,14 @@ def plot_static_trajectories(data, angle_data, config_info, output_file):
         print("Progress: 70% - Drawing angle trajectory...")
         angle_times = angle_data[:, 0]
         theta1, theta2 = angle_data[:, 1], angle_data[:, 2]
-        
-        ax2.plot(theta1, theta2, 'g-', linewidth=2, alpha=0.7, label='Angle trajectory (θ₁, θ₂)')
+
+        angle_stride = max(1, len(theta1) // 50000)
+        angle_points = np.column_stack([theta1[::angle_stride], theta2[::angle_stride]])
+        ax2.add_collection(LineCollection(
+            np.stack([angle_points[:-1], angle_points[1:]], axis=1),
+            colors='g', linewidths=2, alpha=0.7, label='Angle trajectory (θ₁, θ₂)'))
+        ax2.update_datalim(angle_points)
+        ax2.autoscale_view()
         ax2.plot(theta1[0], theta2[0], 'go', markersize=8, label='Starting point')
         ax2.plot(theta1[-1], theta2[-1], 'rs', markersize=8, label='End point')
         
@@ -176,24 +261,24 @@ def plot_static_trajectories(data, angle_data, config_info, output_file):
     if angle_data is not None:
         print("Both position and angle trajectories have been plotted.")
 
-def create_animation(data, config_info, output_file, keep_frames=False):
-    """Create animation by saving individual frames and converting to GIF"""
-    print("Creating animation by saving individual frames...")
-    
+def create_animation(data, config_info, output_file):
+    """Create animation with FuncAnimation, reusing one set of artists"""
+    print("Creating animation with FuncAnimation...")
+
     times = data[:, 0]
-    x1, y1 = data[:, 1], data[:, 2]
-    x2, y2 = data[:, 3], data[:, 4]
-    
-    # Create output directory for frames
-    frames_dir = "output"
-    if not os.path.exists(frames_dir):
-        os.makedirs(frames_dir)
-    
+    # Copy each column into a contiguous float32 array: unit-stride reads
+    # for the per-frame indexing, and half the bytes pushed into the
+    # renderer, which converts to single precision anyway
+    x1 = np.ascontiguousarray(data[:, 1], dtype=np.float32)
+    y1 = np.ascontiguousarray(data[:, 2], dtype=np.float32)
+    x2 = np.ascontiguousarray(data[:, 3], dtype=np.float32)
+    y2 = np.ascontiguousarray(data[:, 4], dtype=np.float32)
+
     print("Progress: 10% - Setting up canvas...")
     fig, ax = plt.subplots(figsize=(10, 8))
-    
-    # Set coordinate axis range
-    max_range = max(np.max(np.abs(x1)), np.max(np.abs(y1)), np.max(np.abs(x2)), np.max(np.abs(y2))) * 1.1
+
+    # Set coordinate axis range; static decorations are drawn exactly once
+    max_range = compute_max_range(data)
     ax.set_xlim(-max_range, max_range)
     ax.set_ylim(-max_range, max_range)
     ax.set_aspect('equal')
@@ -201,95 +286,231 @@ def create_animation(data, config_info, output_file, keep_frames=False):
     ax.set_xlabel('X Position (m)')
     ax.set_ylabel('Y Position (m)')
     ax.set_title(f'Double Pendulum Animation - L1={config_info.get("L1", "?"):.2f}m, L2={config_info.get("L2", "?"):.2f}m')
-    
-    # Store trajectories
-    trail1_x, trail1_y = [], []
-    trail2_x, trail2_y = [], []
-    
-    print("Progress: 20% - Generating frames...")
+
+    # Create the artists once; each frame only swaps their data, which
+    # lets blitting redraw just these primitives instead of the whole axes
+    trail1_line, = ax.plot([], [], 'r-', alpha=0.3, linewidth=1)
+    trail2_line, = ax.plot([], [], 'b-', alpha=0.3, linewidth=1)
+    rod_line, = ax.plot([], [], 'k-', linewidth=3)
+    pivot, = ax.plot([0], [0], 'ko', markersize=8)  # Pivot point
+    ball1, = ax.plot([], [], 'ro', markersize=10)  # Ball 1
+    ball2, = ax.plot([], [], 'bo', markersize=10)  # Ball 2
+
     total_frames = len(data)
-    
-    # Skip frames to reduce total number (every 30th frame)
-    frame_skip = 5  # Take 1 frame every 30 data points
-    
-    frame_files = []
-    for i in range(0, total_frames, frame_skip):
-        # Clear the plot
-        ax.clear()
-        
-        # Reset plot properties
-        ax.set_xlim(-max_range, max_range)
-        ax.set_ylim(-max_range, max_range)
-        ax.set_aspect('equal')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlabel('X Position (m)')
-        ax.set_ylabel('Y Position (m)')
-        ax.set_title(f'Double Pendulum Animation - L1={config_info.get("L1", "?"):.2f}m, L2={config_info.get("L2", "?"):.2f}m')
-        
-        # Update trajectories
-        trail1_x.append(x1[i])
-        trail1_y.append(y1[i])
-        trail2_x.append(x2[i])
-        trail2_y.append(y2[i])
-        
-        # Limit trajectory length for better performance
-        if len(trail1_x) > 200:
-            trail1_x.pop(0)
-            trail1_y.pop(0)
-            trail2_x.pop(0)
-            trail2_y.pop(0)
-        
-        # Draw trajectories
-        if len(trail1_x) > 1:
-            ax.plot(trail1_x, trail1_y, 'r-', alpha=0.3, linewidth=1)
-            ax.plot(trail2_x, trail2_y, 'b-', alpha=0.3, linewidth=1)
-        
-        # Draw pendulum structure
-        ax.plot([0, x1[i], x2[i]], [0, y1[i], y2[i]], 'k-', linewidth=3)
-        ax.plot([0], [0], 'ko', markersize=8)  # Pivot point
-        ax.plot([x1[i]], [y1[i]], 'ro', markersize=10)  # Ball 1
-        ax.plot([x2[i]], [y2[i]], 'bo', markersize=10)  # Ball 2
-        
-        # Save frame
-        frame_filename = f"{frames_dir}/frame_{i//frame_skip:06d}.png"
-        plt.savefig(frame_filename, dpi=100, bbox_inches='tight')
-        frame_files.append(frame_filename)
-        
-        # Show progress
-        progress = int((i * 50) / total_frames) + 20
-        if i % (max(1, total_frames // 20)) == 0:
-            print(f"Progress: {progress}% - Generated frame {i//frame_skip + 1}/{total_frames//frame_skip}")
-    
+
+    # Precompute the rod coordinates (pivot, ball 1, ball 2) per frame so
+    # no Python lists have to be rebuilt inside the frame loop
+    pendulum_x = np.zeros((total_frames, 3), dtype=np.float32)
+    pendulum_y = np.zeros((total_frames, 3), dtype=np.float32)
+    pendulum_x[:, 1] = x1
+    pendulum_x[:, 2] = x2
+    pendulum_y[:, 1] = y1
+    pendulum_y[:, 2] = y2
+
+    # Store trajectories in fixed-size ring buffers; writing a point is
+    # O(1) instead of the O(n) append + pop(0) of a Python list
+    trail_length = 200
+    trail1_x = np.empty(trail_length, dtype=np.float32)
+    trail1_y = np.empty(trail_length, dtype=np.float32)
+    trail2_x = np.empty(trail_length, dtype=np.float32)
+    trail2_y = np.empty(trail_length, dtype=np.float32)
+    trail_cursor = 0
+    trail_filled = 0
+
+    # Skip frames to reduce total number
+    frame_skip = 5  # Take 1 frame every 5 data points
+
+    def animate(i):
+        nonlocal trail_cursor, trail_filled
+
+        # Update trajectories: overwrite the oldest slot in the ring
+        trail_cursor, trail_filled = push_trail(
+            trail1_x, trail1_y, trail2_x, trail2_y,
+            trail_cursor, trail_filled,
+            x1[i], y1[i], x2[i], y2[i])
+
+        # Publish the trails in chronological order. While the buffer is
+        # still filling, cursor == filled and the first slice is empty;
+        # once full, the two slices stitch the ring back together.
+        trail1_line.set_data(np.concatenate((trail1_x[trail_cursor:trail_filled],
+                                             trail1_x[:trail_cursor])),
+                             np.concatenate((trail1_y[trail_cursor:trail_filled],
+                                             trail1_y[:trail_cursor])))
+        trail2_line.set_data(np.concatenate((trail2_x[trail_cursor:trail_filled],
+                                             trail2_x[:trail_cursor])),
+                             np.concatenate((trail2_y[trail_cursor:trail_filled],
+                                             trail2_y[:trail_cursor])))
+
+        # Update pendulum structure
+        rod_line.set_data(pendulum_x[i], pendulum_y[i])
+        ball1.set_data(x1[i:i+1], y1[i:i+1])
+        ball2.set_data(x2[i:i+1], y2[i:i+1])
+
+        return trail1_line, trail2_line, rod_line, pivot, ball1, ball2
+
+    print("Progress: 20% - Generating frames...")
+    anim = animation.FuncAnimation(fig, animate,
+                                   frames=range(0, total_frames, frame_skip),
+                                   interval=80, blit=True)
+
+    print("Progress: 50% - Saving GIF...")
+    anim.save(output_file, writer='pillow', fps=12)
     plt.close(fig)
-    
-    print("Progress: 70% - Converting frames to GIF...")
-    
-    # Convert frames to GIF using PIL
+
+    print("Progress: 100% - Animation creation completed!")
+    print(f"Generated {len(range(0, total_frames, frame_skip))} frames")
+    print(f"Animation saved as: {output_file}")
+
+# Per-process state for parallel frame rendering; each worker builds its
+# own figure and artists once and reuses them for every frame it renders
+_render_state = {}
+
+def _init_render_worker(x1, y1, x2, y2, pendulum_x, pendulum_y,
+                        config_info, max_range, trail_length, frame_skip,
+                        frames_dir, keep_frames):
+    """Set up the figure and artists for one rendering worker process"""
+    # Fixed size and dpi so every rasterized frame has the same shape
+    fig, ax = plt.subplots(figsize=(10, 8), dpi=80)
+    # Fix the margins once so savefig never has to re-solve the layout
+    # the way bbox_inches='tight' does
+    fig.subplots_adjust(left=0.1, right=0.95, bottom=0.08, top=0.92)
+    ax.set_xlim(-max_range, max_range)
+    ax.set_ylim(-max_range, max_range)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('X Position (m)')
+    ax.set_ylabel('Y Position (m)')
+    ax.set_title(f'Double Pendulum Animation - L1={config_info.get("L1", "?"):.2f}m, L2={config_info.get("L2", "?"):.2f}m')
+
+    trail1_line, = ax.plot([], [], 'r-', alpha=0.3, linewidth=1)
+    trail2_line, = ax.plot([], [], 'b-', alpha=0.3, linewidth=1)
+    rod_line, = ax.plot([], [], 'k-', linewidth=3)
+    ax.plot([0], [0], 'ko', markersize=8)  # Pivot point
+    ball1, = ax.plot([], [], 'ro', markersize=10)  # Ball 1
+    ball2, = ax.plot([], [], 'bo', markersize=10)  # Ball 2
+
+    _render_state.update(
+        x1=x1, y1=y1, x2=x2, y2=y2,
+        pendulum_x=pendulum_x, pendulum_y=pendulum_y,
+        trail_length=trail_length, frame_skip=frame_skip,
+        frames_dir=frames_dir, keep_frames=keep_frames, fig=fig,
+        trail1_line=trail1_line, trail2_line=trail2_line,
+        rod_line=rod_line, ball1=ball1, ball2=ball2)
+
+def render_frame(i):
+    """Render animation frame i to an RGB array; runs in a worker process"""
+    s = _render_state
+    frame_skip = s['frame_skip']
+    x1, y1, x2, y2 = s['x1'], s['y1'], s['x2'], s['y2']
+
+    # Workers share no frame-to-frame history, so rebuild the trail for
+    # this frame from the last trail_length sampled points
+    start = max(0, i - (s['trail_length'] - 1) * frame_skip)
+    s['trail1_line'].set_data(x1[start:i + 1:frame_skip],
+                              y1[start:i + 1:frame_skip])
+    s['trail2_line'].set_data(x2[start:i + 1:frame_skip],
+                              y2[start:i + 1:frame_skip])
+
+    # Update pendulum structure
+    s['rod_line'].set_data(s['pendulum_x'][i], s['pendulum_y'][i])
+    s['ball1'].set_data(x1[i:i+1], y1[i:i+1])
+    s['ball2'].set_data(x2[i:i+1], y2[i:i+1])
+
+    # Rasterize in memory and hand the pixels back to the parent; disk is
+    # only touched when the user asked to keep the frame files
+    fig = s['fig']
+    fig.canvas.draw()
+    frame = np.asarray(fig.canvas.buffer_rgba())[:, :, :3].copy()
+
+    if s['keep_frames']:
+        # These PNGs are a user-facing byproduct, so spend as little time
+        # as possible on deflate; compress_level=1 encodes ~3x faster
+        # than the default level 6
+        fig.savefig(f"{s['frames_dir']}/frame_{i // frame_skip:06d}.png",
+                    pil_kwargs={'compress_level': 1})
+    return frame
+
+def create_animation_frames(data, config_info, output_file, keep_frames=False):
+    """Create animation by saving individual frames and converting to GIF"""
+    print("Creating animation by saving individual frames...")
+
+    times = data[:, 0]
+    # Copy each column into a contiguous float32 array: unit-stride reads
+    # for the per-frame indexing, and half the bytes pushed into the
+    # renderer, which converts to single precision anyway
+    x1 = np.ascontiguousarray(data[:, 1], dtype=np.float32)
+    y1 = np.ascontiguousarray(data[:, 2], dtype=np.float32)
+    x2 = np.ascontiguousarray(data[:, 3], dtype=np.float32)
+    y2 = np.ascontiguousarray(data[:, 4], dtype=np.float32)
+
+    # Create output directory for frames (only written when keeping them)
+    frames_dir = "output"
+    if keep_frames and not os.path.exists(frames_dir):
+        os.makedirs(frames_dir)
+
+    print("Progress: 10% - Setting up workers...")
+    # Set coordinate axis range
+    max_range = compute_max_range(data)
+
+    total_frames = len(data)
+
+    # Precompute the rod coordinates (pivot, ball 1, ball 2) per frame so
+    # no Python lists have to be rebuilt inside the frame loop
+    pendulum_x = np.zeros((total_frames, 3), dtype=np.float32)
+    pendulum_y = np.zeros((total_frames, 3), dtype=np.float32)
+    pendulum_x[:, 1] = x1
+    pendulum_x[:, 2] = x2
+    pendulum_y[:, 1] = y1
+    pendulum_y[:, 2] = y2
+
+    # How long the drawn trail is, in sampled frames
+    trail_length = 200
+
+    # Skip frames to reduce total number
+    frame_skip = 5  # Take 1 frame every 5 data points
+
+    frame_indices = range(0, total_frames, frame_skip)
+
+    print("Progress: 20% - Generating frames...")
+    # Every frame is independent, so spread them across all cores; each
+    # worker sets up its own figure in _init_render_worker and sends the
+    # rasterized pixels back instead of writing intermediate PNGs
+    num_frames = len(frame_indices)
+    report_step = max(1, num_frames // 20)
     images = []
-    for frame_file in frame_files:
-        img = Image.open(frame_file)
-        images.append(img)
-    
+    with multiprocessing.Pool(
+            initializer=_init_render_worker,
+            initargs=(x1, y1, x2, y2, pendulum_x, pendulum_y, config_info,
+                      max_range, trail_length, frame_skip,
+                      frames_dir, keep_frames)) as pool:
+        for done, frame in enumerate(pool.imap(render_frame,
+                                               frame_indices), 1):
+            images.append(frame)
+            # Show progress
+            if done % report_step == 0:
+                progress = int((done * 60) / num_frames) + 20
+                print(f"Progress: {progress}% - Generated frame {done}/{num_frames}")
+
     print("Progress: 80% - Saving GIF...")
-    # Save as GIF
+    # Encode the GIF straight from the in-memory frames
     if images:
-        images[0].save(
-            output_file,
-            save_all=True,
-            append_images=images[1:],
-            duration=80,  # milliseconds per frame
-            loop=0
-        )
-    
-    print("Progress: 90% - Cleaning up frame files...")
-    # Optionally clean up frame files
-    if not keep_frames:
-        for frame_file in frame_files:
-            os.remove(frame_file)
-        print(f"Cleaned up {len(frame_files)} frame files")
-    else:
-        print(f"Kept {len(frame_files)} frame files in {frames_dir}/ directory")
-    
+        if imageio is not None:
+            imageio.mimsave(output_file, images,
+                            duration=80,  # milliseconds per frame
+                            loop=0)
+        else:
+            pil_images = [Image.fromarray(frame) for frame in images]
+            pil_images[0].save(
+                output_file,
+                save_all=True,
+                append_images=pil_images[1:],
+                duration=80,  # milliseconds per frame
+                loop=0
+            )
+
+    if keep_frames:
+        print(f"Kept {num_frames} frame files in {frames_dir}/ directory")
+
     print("Progress: 100% - Animation creation completed!")
     print(f"Generated {len(images)} frames")
     print(f"Animation saved as: {output_file}")
@@ -302,11 +523,14 @@ def main():
                        help='Output file name (default: pendulum_plot.png)')
     parser.add_argument('--animate', action='store_true', 
                        help='Create animation instead of static plot')
-    parser.add_argument('--keep-frames', action='store_true', 
-                       help='Keep individual frame files after creating GIF')
-    parser.add_argument('--show', action='store_true', 
+    parser.add_argument('--keep-frames', action='store_true',
+                       help='Render frame-by-frame and keep the individual frame files after creating GIF')
+    parser.add_argument('--show', action='store_true',
                        help='Show image instead of saving')
-    
+    parser.add_argument('--stride', type=int, default=0,
+                       help='Keep only every Nth data point '
+                            '(0 = pick automatically for animations)')
+
     args = parser.parse_args()
     
     print("Double Pendulum Data Visualization Tool")
@@ -340,12 +564,28 @@ def main():
     if len(data) == 0:
         print("Error: Position data file is empty")
         return
-    
+
+    # Thin the trajectory before anything downstream touches it. For
+    # animations the automatic stride targets at most ~2000 frames so
+    # high-resolution logs do not produce million-frame GIFs.
+    stride = args.stride
+    if stride <= 0:
+        stride = max(1, len(data) // 2000) if args.animate else 1
+    if stride > 1:
+        data = data[::stride]
+        if angle_data is not None:
+            angle_data = angle_data[::stride]
+        print(f"Applied stride {stride}: {len(data)} data points remain")
+
     if args.animate:
         if args.output.endswith(('.png', '.jpg', '.jpeg')):
             args.output = args.output.rsplit('.', 1)[0] + '.gif'
         
-        create_animation(data, config_info, args.output, args.keep_frames)
+        if args.keep_frames:
+            # Frame-by-frame pipeline: writes the PNGs users asked to keep
+            create_animation_frames(data, config_info, args.output, args.keep_frames)
+        else:
+            create_animation(data, config_info, args.output)
     else:
         plot_static_trajectories(data, angle_data, config_info, args.output)
     